@@ -207,16 +207,15 @@ def _copy_output_paths(
     remote_paths = sorted(_list_files(instance, remote_cwd.parent))
     output_files = target_path / "files"
 
+    # We listed the parent of the build tree in order to allow output.paths
+    # to reference the parent directory.  The patterns are still relative
+    # to the build tree, though, so make our paths relative to the build
+    # tree again so that they can be matched properly.  This doesn't depend
+    # on the pattern, so only do it once.
+    paths = [os.path.relpath(path, remote_cwd.name) for path in remote_paths]
+
     filtered_paths: Set[PurePath] = set()
     for path_pattern in output.paths:
-        # We listed the parent of the build tree in order to allow
-        # output.paths to reference the parent directory.  The patterns are
-        # still relative to the build tree, though, so make our paths
-        # relative to the build tree again so that they can be matched
-        # properly.
-        paths = [
-            os.path.relpath(path, remote_cwd.name) for path in remote_paths
-        ]
         result = fnmatch.filter(paths, path_pattern)
         if not result:
             raise CommandError(
@@ -630,6 +629,15 @@ def _get_job_instance_name(provider: Provider, job: Job) -> str:
     )
 
 
+def _load_secrets(path: Optional[Path]) -> Dict[str, str]:
+    """Return the secrets in the given YAML file, if any."""
+    if not path:
+        return {}
+    with open(path, "rb") as f:
+        secrets: Dict[str, str] = yaml.safe_load(f)
+    return secrets
+
+
 class RunCommand(BaseCommand):
     """Run a pipeline, launching managed environments as needed."""
 
@@ -721,11 +729,7 @@ class RunCommand(BaseCommand):
         provider = get_provider()
         provider.ensure_provider_is_available()
 
-        secrets = {}
-        if args.secrets_file:
-            with open(args.secrets_file) as f:
-                content = f.read()
-            secrets = yaml.safe_load(content)
+        secrets = _load_secrets(args.secrets_file)
         for stage in config.pipeline:
             stage_failed = False
             for job_name in stage:
@@ -895,11 +899,7 @@ class RunOneCommand(BaseCommand):
         provider = get_provider()
         provider.ensure_provider_is_available()
 
-        secrets = {}
-        if args.secrets_file:
-            with open(args.secrets_file) as f:
-                content = f.read()
-            secrets = yaml.safe_load(content)
+        secrets = _load_secrets(args.secrets_file)
         # we prefer package repositories via CLI more
         # so they need to come first
         # also see sources.list(5)
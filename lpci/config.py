@@ -5,7 +5,20 @@ import re
 from datetime import timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pydantic
 from craft_cli import emit
@@ -19,6 +32,30 @@ from lpci.utils import load_yaml
 LAUNCHPAD_PPA_BASE_URL = "https://ppa.launchpadcontent.net"
 
 
+def _make_pattern_validator(
+    pattern: Pattern[str],
+) -> Callable[[Any], str]:
+    """Return a validator for strict strings matching `pattern`.
+
+    This raises the same errors as a strict `pydantic.ConstrainedStr` with
+    a `regex`, but is a single call rather than a chain of validators.
+    """
+    match = pattern.match
+
+    def validate(value: Any) -> str:
+        if not isinstance(value, str) or isinstance(value, Enum):
+            raise pydantic.errors.StrError()
+        if match(value) is None:
+            raise pydantic.errors.StrRegexError(pattern=pattern.pattern)
+        return value
+
+    return validate
+
+
+_IDENTIFIER_RE = re.compile(r"^[a-z0-9][a-z0-9\+\._\-]+$")
+_validate_identifier = _make_pattern_validator(_IDENTIFIER_RE)
+
+
 class _Identifier(pydantic.ConstrainedStr):
     """A string with constrained syntax used as a short identifier.
 
@@ -27,7 +64,11 @@ class _Identifier(pydantic.ConstrainedStr):
     """
 
     strict = True
-    regex = re.compile(r"^[a-z0-9][a-z0-9\+\._\-]+$")
+    regex = _IDENTIFIER_RE
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], str], None, None]:
+        yield _validate_identifier
 
 
 class ModelConfigDefaults(
@@ -70,13 +111,25 @@ class Input(ModelConfigDefaults):
     target_directory: StrictStr
 
 
+_plugin_config_keys: Dict[Type[BasePlugin], Tuple[str, ...]] = {}
+
+
+def _get_plugin_config_keys(plugin: Type[BasePlugin]) -> Tuple[str, ...]:
+    """Return the configuration keys accepted by a plugin."""
+    if plugin not in _plugin_config_keys:
+        _plugin_config_keys[plugin] = tuple(
+            plugin.Config.schema()["properties"].keys()
+        )
+    return _plugin_config_keys[plugin]
+
+
 def _validate_plugin_config(
     plugin: Type[BasePlugin],
     values: Dict[StrictStr, Any],
-    job_fields: List[str],
+    job_fields: Container[str],
 ) -> Dict[StrictStr, Any]:
     plugin_config = {}
-    for k in plugin.Config.schema()["properties"].keys():
+    for k in _get_plugin_config_keys(plugin):
         # configuration key belongs to the plugin
         if k in values and k not in job_fields:
             # TODO: should some error be raised if a plugin tries consuming
@@ -124,16 +177,29 @@ class PackageSuite(str, Enum):
     noble = "noble"  # 24.04
 
 
+# Looking series up in a plain dict is cheaper than going through the Enum
+# machinery with `PackageSuite[series]`.
+_SERIES_TO_SUITE = {suite.name: suite for suite in PackageSuite}
+
+
+# Support the two-segment form: OWNER/ARCHIVE (e.g. `launchpad/ppa`)
+# and the three-segment form: OWNER/DISTRIBUTION/ARCHIVE
+# (e.g. `launchpad/debian/ppa`).
+_PPA_SHORT_FORM_URL_RE = re.compile(
+    r"^[a-z0-9][a-z0-9\+\._\-]+(/[a-z0-9][a-z0-9\+\._\-]+){1,2}$"
+)
+_validate_ppa_short_form_url = _make_pattern_validator(_PPA_SHORT_FORM_URL_RE)
+
+
 class PPAShortFormURL(pydantic.ConstrainedStr):
     """A string with a constrained syntax to match a PPA short form URL."""
 
     strict = True
-    # Support the two-segment form: OWNER/ARCHIVE (e.g. `launchpad/ppa`)
-    # and the three-segment form: OWNER/DISTRIBUTION/ARCHIVE
-    # (e.g. `launchpad/debian/ppa`).
-    regex = re.compile(
-        r"^[a-z0-9][a-z0-9\+\._\-]+(/[a-z0-9][a-z0-9\+\._\-]+){1,2}$"
-    )
+    regex = _PPA_SHORT_FORM_URL_RE
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], str], None, None]:
+        yield _validate_ppa_short_form_url
 
 
 def get_ppa_url_parts(ppa_url: PPAShortFormURL) -> Tuple[str, str, str]:
@@ -155,7 +221,9 @@ class PackageRepository(ModelConfigDefaults):
 
     type: PackageType  # e.g. `apt``
     ppa: Optional[PPAShortFormURL] = None  # e.g. `launchpad/ubuntu/ppa`
-    formats: Optional[List[PackageFormat]] = None  # e.g. `[deb, deb-src]`
+    formats: Optional[List[PackageFormat]] = pydantic.Field(
+        default_factory=lambda: [PackageFormat.deb]
+    )  # e.g. `[deb, deb-src]`
     components: Optional[List[PackageComponent]] = None  # e.g. `[main]`
     suites: Optional[List[PackageSuite]] = None  # e.g. `[bionic, focal]`
     url: Optional[AnyHttpUrl] = None
@@ -204,15 +272,12 @@ class PackageRepository(ModelConfigDefaults):
     ) -> AnyHttpUrl:
         if v is None and values["ppa"]:
             owner, distribution, archive = get_ppa_url_parts(values["ppa"])
-            v = "{}/{}/{}/{}".format(
-                LAUNCHPAD_PPA_BASE_URL,
-                owner,
-                archive,
-                distribution,
-            )
+            v = f"{LAUNCHPAD_PPA_BASE_URL}/{owner}/{archive}/{distribution}"
         return v
 
-    @validator("formats", pre=True, always=True)
+    # An omitted `formats` key gets its default from the field, but an
+    # explicit null or empty list also means the default.
+    @validator("formats", pre=True)
     def set_formats_default_value(
         cls, v: List[PackageFormat]
     ) -> List[PackageFormat]:
@@ -232,13 +297,20 @@ class PackageRepository(ModelConfigDefaults):
         """  # noqa: E501
         assert self.formats is not None
         assert self.suites is not None
+        assert self.components is not None
+        # Everything after the format apart from the suite is the same on
+        # every line, so only build those parts once.
+        if self.trusted:
+            options = f" [trusted={self.trusted}]"
+        else:
+            options = ""
+        url = str(self.url)
+        components = " ".join(self.components)
+        suites = [suite.value for suite in self.suites]
         for format in self.formats:
-            for suite in self.suites:
-                assert self.components is not None
-                if self.trusted:
-                    yield f"{format.value} [trusted={self.trusted}] {self.url!s} {suite.value} {' '.join(self.components)}"  # noqa: E501
-                else:
-                    yield f"{format.value} {self.url!s} {suite.value} {' '.join(self.components)}"  # noqa: E501
+            prefix = f"{format.value}{options} {url}"
+            for suite in suites:
+                yield f"{prefix} {suite} {components}"
 
 
 class Snap(ModelConfigDefaults):
@@ -352,15 +424,12 @@ class Job(ModelConfigDefaults):
     def validate_package_repositories(
         cls, v: List[PackageRepository], values: Dict[StrictStr, Any]
     ) -> List[PackageRepository]:
-        package_repositories = None
-        for index, package_repository in enumerate(v):
+        for package_repository in v:
             if not package_repository.suites:
-                if not package_repositories:
-                    package_repositories = v.copy()
-                package_repositories[index].suites = [
-                    PackageSuite[values["series"]]
+                package_repository.suites = [
+                    _SERIES_TO_SUITE[values["series"]]
                 ]
-        return package_repositories or v
+        return v
 
     @pydantic.root_validator(pre=True)
     def move_plugin_config_settings(
@@ -368,14 +437,16 @@ class Job(ModelConfigDefaults):
     ) -> Dict[StrictStr, Any]:
         """Delegate plugin settings to the plugin."""
         if "plugin" in values:
-            base_values = values.copy()
             if values["plugin"] not in PLUGINS:
                 raise ConfigurationError("Unknown plugin")
             plugin = PLUGINS[values["plugin"]]
+            # Pydantic passes a fresh dict of keyword arguments to root
+            # validators, so it's safe to move the plugin settings out of
+            # it in place.
             return _validate_plugin_config(
                 plugin=plugin,
-                values=base_values,
-                job_fields=list(cls.__fields__.keys()),
+                values=values,
+                job_fields=cls.__fields__,
             )
         return values
 
@@ -383,17 +454,11 @@ class Job(ModelConfigDefaults):
 def _expand_job_values(
     values: Dict[StrictStr, Any]
 ) -> List[Dict[StrictStr, Any]]:
-    expanded_values = []
-    if "matrix" in values:
-        base_values = values.copy()
-        del base_values["matrix"]
-        for variant in values["matrix"]:
-            variant_values = base_values.copy()
-            variant_values.update(variant)
-            expanded_values.append(variant_values)
-    else:
-        expanded_values.append(values)
-    return expanded_values
+    if "matrix" not in values:
+        return [values]
+    base_values = values.copy()
+    del base_values["matrix"]
+    return [{**base_values, **variant} for variant in values["matrix"]]
 
 
 class License(ModelConfigDefaults):
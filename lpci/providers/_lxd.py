@@ -145,12 +145,11 @@ class LXDProvider(Provider):
                 raise CommandError(str(error)) from error
 
         project_name = sanitize_lxd_instance_name(project_name)
+        instance_name_pattern = re.compile(
+            rf"^lpci-{re.escape(project_name)}-{re.escape(inode)}-.+-.+$"
+        )
         for instance in instances:
-            if re.match(
-                rf"^lpci-{re.escape(project_name)}-{re.escape(inode)}"
-                rf"-.+-.+$",
-                instance,
-            ):
+            if instance_name_pattern.match(instance):
                 emit.trace(f"Deleting container {instance!r}.")
                 try:
                     self.lxc.delete(
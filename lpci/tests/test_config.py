@@ -38,7 +38,9 @@ class TestConfig(TestCase):
         self.tempdir = Path(self.useFixture(TempDir()).path)
         # `Path.cwd()` is assumed as the project directory.
         # So switch to the created project directory.
+        cwd = os.getcwd()
         os.chdir(self.tempdir)
+        self.addCleanup(os.chdir, cwd)
 
     def create_config(self, text):
         path = self.tempdir / ".launchpad.yaml"
@@ -177,6 +179,25 @@ class TestConfig(TestCase):
             ValidationError, r"string does not match regex", Config.load, path
         )
 
+    def test_series_name_not_a_string(self):
+        # Series names must be strings, not just things that look like them.
+        path = self.create_config(
+            dedent(
+                """
+                pipeline:
+                    - test
+
+                jobs:
+                    test:
+                        series: 20.04
+                        architectures: amd64
+                """
+            )
+        )
+        self.assertRaisesRegex(
+            ValidationError, r"str type expected", Config.load, path
+        )
+
     def test_bad_architecture_name(self):
         # Architecture names must be identifiers.
         path = self.create_config(
@@ -736,6 +757,37 @@ class TestConfig(TestCase):
             list(package_repository_2.sources_list_lines()),
         )
 
+    def test_empty_package_repository_formats_use_default(self):
+        # An explicitly empty or null `formats` is treated like a missing
+        # one.
+        path = self.create_config(
+            dedent(
+                """
+                pipeline:
+                    - test
+                jobs:
+                    test:
+                        series: focal
+                        architectures: amd64
+                        packages: [foo]
+                        package-repositories:
+                            - type: apt
+                              ppa: launchpad/ubuntu/ppa
+                              formats: []
+                            - type: apt
+                              ppa: launchpad/ubuntu/ppa
+                              formats:
+                """
+            )
+        )
+        config = Config.load(path)
+
+        package_repositories = config.jobs["test"][0].package_repositories
+        self.assertEqual(
+            [["deb"], ["deb"]],
+            [repository.formats for repository in package_repositories],
+        )
+
     def test_missing_ppa_and_url(self):
         path = self.create_config(
             dedent(
@@ -17,6 +17,10 @@ import yaml
 
 from lpci.errors import ConfigurationError
 
+# Prefer libyaml's C implementation where PyYAML was built with it; the
+# pure-Python loader is much slower.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml(path: Path) -> Dict[Any, Any]:
     """Return the content of a YAML file."""
@@ -24,7 +28,7 @@ def load_yaml(path: Path) -> Dict[Any, Any]:
         raise ConfigurationError(f"Couldn't find config file {str(path)!r}")
     try:
         with path.open("rb") as f:
-            loaded = yaml.safe_load(f)
+            loaded = yaml.load(f, Loader=_SafeLoader)
         if not isinstance(loaded, dict):
             raise ConfigurationError(
                 f"Config file {str(path)!r} does not define a mapping"